@@ -25,6 +25,21 @@ from .backend import OpenStackBackendError
 logger = logging.getLogger(__name__)
 
 
+class FieldsCacheMixin(object):
+    """
+    Build serializer fields once per class and return deep copies afterwards,
+    so that binding fields to one serializer does not affect another one.
+    Use it only for serializers which fields do not depend on request or context.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super(FieldsCacheMixin, self).get_fields()
+        return copy.deepcopy(self._fields_cache[cls])
+
+
 class ServiceSerializer(core_serializers.ExtraFieldOptionsMixin,
                         core_serializers.RequiredFieldsMixin,
                         structure_serializers.BaseServiceSerializer):
@@ -172,7 +187,7 @@ class FloatingIPSerializer(structure_serializers.BaseResourceSerializer):
         return super(FloatingIPSerializer, self).validate(attrs)
 
 
-class SecurityGroupRuleSerializer(serializers.ModelSerializer):
+class SecurityGroupRuleSerializer(FieldsCacheMixin, serializers.ModelSerializer):
 
     class Meta:
         model = models.SecurityGroupRule
@@ -268,11 +283,16 @@ class SecurityGroupRuleListUpdateSerializer(serializers.ListSerializer):
     @transaction.atomic()
     def save(self, **kwargs):
         security_group = self.context['view'].get_object()
-        old_rules_count = security_group.rules.count()
         rules = self.validated_data
-        security_group.rules.exclude(id__in=[r.id for r in rules if r.id]).delete()
-        for rule in rules:
+        existing_rules = [rule for rule in rules if rule.id]
+        new_rules = [rule for rule in rules if not rule.id]
+        existing_rule_ids = {rule.id for rule in existing_rules}
+        deleted_rules_count = security_group.rules.exclude(id__in=existing_rule_ids).delete()[0]
+        # Existing rules are validated to belong to the security group.
+        old_rules_count = deleted_rules_count + len(existing_rule_ids)
+        for rule in existing_rules:
             rule.save()
+        security_group.rules.bulk_create(new_rules)
         security_group.change_backend_quotas_usage_on_rules_update(old_rules_count)
         return rules
 
@@ -305,7 +325,6 @@ class SecurityGroupSerializer(structure_serializers.BaseResourceSerializer):
             if rule.id is not None:
                 raise serializers.ValidationError(
                     _('Cannot add existed rule with id %s to new security group') % rule.id)
-            rule.full_clean(exclude=['security_group'])
         return value
 
     def validate_name(self, value):
@@ -329,7 +348,8 @@ class SecurityGroupSerializer(structure_serializers.BaseResourceSerializer):
             # so we cannot execute BaseResourceSerializer create method.
             security_group = super(structure_serializers.BaseResourceSerializer, self).create(validated_data)
             for rule in rules:
-                security_group.rules.add(rule, bulk=False)
+                rule.security_group = security_group
+            security_group.rules.bulk_create(rules)
             security_group.increase_backend_quotas_usage()
         return security_group
 
@@ -584,7 +604,7 @@ class TenantSerializer(structure_serializers.PrivateCloudSerializer):
         return tenant
 
 
-class _NestedSubNetSerializer(serializers.ModelSerializer):
+class _NestedSubNetSerializer(FieldsCacheMixin, serializers.ModelSerializer):
 
     class Meta(object):
         model = models.SubNet
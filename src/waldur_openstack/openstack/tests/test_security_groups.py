@@ -79,6 +79,26 @@ class SecurityGroupCreateTest(BaseSecurityGroupTest):
         self.assertEqual(models.SecurityGroup.objects.count(), 0)
         self.assertEqual(models.SecurityGroupRule.objects.count(), 0)
 
+    def test_can_not_create_security_group_with_port_out_of_range(self):
+        self.client.force_authenticate(self.fixture.staff)
+
+        data = {
+            'name': 'https',
+            'rules': [
+                {
+                    'protocol': 'tcp',
+                    'from_port': 8001,
+                    'to_port': 65536,
+                    'cidr': '11.11.1.2/24',
+                }
+            ]
+        }
+        response = self.client.post(self.url, data=data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(models.SecurityGroup.objects.count(), 0)
+        self.assertEqual(models.SecurityGroupRule.objects.count(), 0)
+
     def test_can_not_create_security_group_with_invalid_cidr(self):
         self.client.force_authenticate(self.fixture.staff)
 
@@ -0,0 +1,43 @@
+from django.test import TestCase
+
+from waldur_openstack.openstack import serializers
+
+
+class FieldsCacheMixinTest(TestCase):
+
+    def test_each_serializer_gets_its_own_field_instances(self):
+        first = serializers.SecurityGroupRuleSerializer()
+        second = serializers.SecurityGroupRuleSerializer()
+
+        self.assertEqual(list(first.fields.keys()), list(second.fields.keys()))
+        for name in first.fields:
+            self.assertIsNot(first.fields[name], second.fields[name])
+            self.assertIs(first.fields[name].parent, first)
+            self.assertIs(second.fields[name].parent, second)
+
+    def test_binding_fields_of_one_serializer_does_not_affect_another(self):
+        first = serializers.SecurityGroupRuleSerializer()
+        first_validators = first.fields['from_port'].validators
+        first_validators.append(lambda value: None)
+
+        second = serializers.SecurityGroupRuleSerializer()
+        second_validators = second.fields['from_port'].validators
+
+        self.assertIsNot(first_validators, second_validators)
+        self.assertEqual(len(first_validators), len(second_validators) + 1)
+        self.assertEqual(second.fields['from_port'].field_name, 'from_port')
+
+    def test_nested_list_serializer_children_do_not_share_fields(self):
+        first = serializers.SecurityGroupRuleSerializer(many=True)
+        second = serializers.SecurityGroupRuleSerializer(many=True)
+
+        for name in first.child.fields:
+            self.assertIsNot(first.child.fields[name], second.child.fields[name])
+            self.assertIs(first.child.fields[name].parent, first.child)
+            self.assertIs(second.child.fields[name].parent, second.child)
+
+    def test_fields_are_cached_per_serializer_class(self):
+        rule_fields = serializers.SecurityGroupRuleSerializer().fields
+        subnet_fields = serializers._NestedSubNetSerializer().fields
+
+        self.assertNotEqual(list(rule_fields.keys()), list(subnet_fields.keys()))
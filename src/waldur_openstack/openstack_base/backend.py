@@ -28,6 +28,17 @@ from waldur_openstack.openstack.models import Tenant
 
 logger = logging.getLogger(__name__)
 
+# Values used for security group rule fields that OpenStack reports as null
+_SG_RULE_DEFAULTS = {
+    'protocol': '',
+    'remote_ip_prefix': '0.0.0.0/0',
+    'port_range_min': -1,
+    'port_range_max': -1,
+}
+
+# Session is considered expired if it is going to expire within this period
+_EXPIRY_GRACE = datetime.timedelta(minutes=10)
+
 
 class OpenStackBackendError(SerializableBackendError):
     pass
@@ -81,7 +92,7 @@ class OpenStackSession(dict):
         return cls(ks_session=ks_session)
 
     def validate(self):
-        if self.auth.auth_ref.expires > timezone.now() + datetime.timedelta(minutes=10):
+        if self.auth.auth_ref.expires - _EXPIRY_GRACE > timezone.now():
             return True
 
         raise OpenStackSessionExpired('OpenStack session is expired')
@@ -323,17 +334,9 @@ class BaseOpenStackBackend(ServiceBackend):
         }
 
     def _normalize_security_group_rule(self, rule):
-        if rule['protocol'] is None:
-            rule['protocol'] = ''
-
-        if rule['remote_ip_prefix'] is None:
-            rule['remote_ip_prefix'] = '0.0.0.0/0'
-
-        if rule['port_range_min'] is None:
-            rule['port_range_min'] = -1
-
-        if rule['port_range_max'] is None:
-            rule['port_range_max'] = -1
+        for key, default in _SG_RULE_DEFAULTS.items():
+            if rule.get(key) is None:
+                rule[key] = default
 
         return rule
 
@@ -292,6 +292,7 @@ class OpenStackTenantBackend(BaseOpenStackBackend):
             subnet__settings=self.settings).exclude(backend_id='')}
 
         # Step 2. Update or create imported IPs
+        ips_to_create = []
         for backend_id in ips_to_update:
             imported_ip = imported_ips[backend_id]
             floating_ip = floating_ips.get(backend_id)
@@ -303,7 +304,7 @@ class OpenStackTenantBackend(BaseOpenStackBackend):
 
             imported_ip.internal_ip = internal_ip
             if not floating_ip:
-                imported_ip.save()
+                ips_to_create.append(imported_ip)
             else:
                 fields_to_update = models.FloatingIP.get_backend_fields() + ('internal_ip',)
                 if floating_ip.address != floating_ip.name:
@@ -312,6 +313,8 @@ class OpenStackTenantBackend(BaseOpenStackBackend):
 
                 update_pulled_fields(floating_ip, imported_ip, fields_to_update)
 
+        models.FloatingIP.objects.bulk_create(ips_to_create, batch_size=100)
+
         # Step 3. Delete stale IPs
         ips_to_delete = set(floating_ips) - set(imported_ips)
         models.FloatingIP.objects.filter(settings=self.settings,
@@ -606,16 +609,55 @@ class OpenStackTenantBackend(BaseOpenStackBackend):
 
             update_pulled_fields(volume, imported_volume, update_fields)
 
+    @log_backend_action()
+    def pull_instance_volumes(self, instance, update_fields=None):
+        """ Pull all volumes of the instance using single Cinder request """
+        import_time = timezone.now()
+        cinder = self.cinder_client
+        try:
+            backend_volumes = cinder.volumes.list()
+        except cinder_exceptions.ClientException as e:
+            six.reraise(OpenStackBackendError, e)
+        backend_volumes_map = {backend_volume.id: backend_volume for backend_volume in backend_volumes}
+
+        if not update_fields:
+            update_fields = models.Volume.get_backend_fields()
+
+        for volume in instance.volumes.filter(modified__lt=import_time):
+            try:
+                backend_volume = backend_volumes_map[volume.backend_id]
+            except KeyError:
+                continue
+            imported_volume = self._backend_volume_to_volume(backend_volume)
+            update_pulled_fields(volume, imported_volume, update_fields)
+
     @log_backend_action()
     def pull_volume_runtime_state(self, volume):
+        self._pull_volume_runtime_state(volume)
+
+    @log_backend_action()
+    def pull_attached_volume_runtime_state(self, volume):
+        """ Pull volume runtime state and device name using the same backend request """
+        self._pull_volume_runtime_state(volume, pull_device=True)
+
+    def _pull_volume_runtime_state(self, volume, pull_device=False):
         cinder = self.cinder_client
         try:
             backend_volume = cinder.volumes.get(volume.backend_id)
         except cinder_exceptions.ClientException as e:
             six.reraise(OpenStackBackendError, e)
+        update_fields = []
         if backend_volume.status != volume.runtime_state:
             volume.runtime_state = backend_volume.status
-            volume.save(update_fields=['runtime_state'])
+            update_fields.append('runtime_state')
+        # In our setup volume could be attached only to one instance.
+        if pull_device and getattr(backend_volume, 'attachments', False):
+            device = backend_volume.attachments[0].get('device', '')
+            if device != volume.device:
+                volume.device = device
+                update_fields.append('device')
+        if update_fields:
+            volume.save(update_fields=update_fields)
 
     @log_backend_action('check is volume deleted')
     def is_volume_deleted(self, volume):
@@ -1145,14 +1187,12 @@ class OpenStackTenantBackend(BaseOpenStackBackend):
         instance.security_groups.remove(*stale_groups)
 
         # add missing groups
-        for group_id in backend_ids - nc_ids:
-            try:
-                security_group = models.SecurityGroup.objects.get(settings=self.settings, backend_id=group_id)
-            except models.SecurityGroup.DoesNotExist:
-                logger.exception(
-                    'Security group with id %s does not exist at Waldur. Tenant : %s' % (group_id, instance.tenant))
-            else:
-                instance.security_groups.add(security_group)
+        missing_ids = backend_ids - nc_ids
+        security_groups = list(models.SecurityGroup.objects.filter(settings=self.settings, backend_id__in=missing_ids))
+        for group_id in missing_ids - set(group.backend_id for group in security_groups):
+            logger.error(
+                'Security group with id %s does not exist at Waldur. Tenant : %s' % (group_id, instance.tenant))
+        instance.security_groups.add(*security_groups)
 
     @log_backend_action()
     def push_instance_security_groups(self, instance):
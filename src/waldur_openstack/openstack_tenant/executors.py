@@ -1,5 +1,7 @@
 from __future__ import unicode_literals
 
+import functools
+
 from celery import chain
 
 from waldur_core.core import executors as core_executors
@@ -10,23 +12,34 @@ from waldur_openstack.openstack import executors as openstack_executors
 
 from . import tasks, models
 
+_BACKEND = core_tasks.BackendMethodTask()
+_POLL = core_tasks.PollRuntimeStateTask()
+_POLL_BACKOFF = tasks.PollRuntimeStateBackoffTask()
+_POLL_CHECK = core_tasks.PollBackendCheckTask()
+_STATE = core_tasks.StateTransitionTask()
+_THROTTLE = tasks.ThrottleProvisionTask()
+
+_VOLUME_AVAILABLE_POLL = functools.partial(
+    _POLL_BACKOFF.si,
+    backend_pull_method='pull_volume_runtime_state',
+    success_state='available',
+    erred_state='error',
+    initial_delay=1,
+    max_delay=30,
+)
+
 
 class VolumeCreateExecutor(core_executors.CreateExecutor):
 
     @classmethod
     def get_task_signature(cls, volume, serialized_volume, **kwargs):
         return chain(
-            tasks.ThrottleProvisionTask().si(
+            _THROTTLE.si(
                 serialized_volume,
                 'create_volume',
                 state_transition='begin_creating'
             ),
-            core_tasks.PollRuntimeStateTask().si(
-                serialized_volume,
-                backend_pull_method='pull_volume_runtime_state',
-                success_state='available',
-                erred_state='error',
-            ).set(countdown=30)
+            _VOLUME_AVAILABLE_POLL(serialized_volume)
         )
 
 
@@ -36,10 +49,10 @@ class VolumeUpdateExecutor(core_executors.UpdateExecutor):
     def get_task_signature(cls, volume, serialized_volume, **kwargs):
         updated_fields = kwargs['updated_fields']
         if 'name' in updated_fields or 'description' in updated_fields:
-            return core_tasks.BackendMethodTask().si(
+            return _BACKEND.si(
                 serialized_volume, 'update_volume', state_transition='begin_updating')
         else:
-            return core_tasks.StateTransitionTask().si(serialized_volume, state_transition='begin_updating')
+            return _STATE.si(serialized_volume, state_transition='begin_updating')
 
 
 class VolumeDeleteExecutor(core_executors.DeleteExecutor):
@@ -48,12 +61,12 @@ class VolumeDeleteExecutor(core_executors.DeleteExecutor):
     def get_task_signature(cls, volume, serialized_volume, **kwargs):
         if volume.backend_id:
             return chain(
-                core_tasks.BackendMethodTask().si(
+                _BACKEND.si(
                     serialized_volume, 'delete_volume', state_transition='begin_deleting'),
-                core_tasks.PollBackendCheckTask().si(serialized_volume, 'is_volume_deleted'),
+                _POLL_CHECK.si(serialized_volume, 'is_volume_deleted'),
             )
         else:
-            return core_tasks.StateTransitionTask().si(serialized_volume, state_transition='begin_deleting')
+            return _STATE.si(serialized_volume, state_transition='begin_deleting')
 
 
 class VolumePullExecutor(core_executors.ActionExecutor):
@@ -61,7 +74,7 @@ class VolumePullExecutor(core_executors.ActionExecutor):
 
     @classmethod
     def get_task_signature(cls, volume, serialized_volume, **kwargs):
-        return core_tasks.BackendMethodTask().si(
+        return _BACKEND.si(
             serialized_volume, 'pull_volume',
             state_transition='begin_updating')
 
@@ -83,62 +96,49 @@ class VolumeExtendExecutor(core_executors.ActionExecutor):
         if volume.instance is not None:
             volume.instance.action = 'Extend volume'
             volume.instance.schedule_updating()
-            volume.instance.save()
+            volume.instance.save(update_fields=['state', 'action'])
 
     @classmethod
     def get_task_signature(cls, volume, serialized_volume, **kwargs):
         if volume.instance is None:
             return chain(
-                core_tasks.BackendMethodTask().si(
+                _BACKEND.si(
                     serialized_volume,
                     backend_method='extend_volume',
                     state_transition='begin_updating',
                 ),
-                core_tasks.PollRuntimeStateTask().si(
-                    serialized_volume,
-                    backend_pull_method='pull_volume_runtime_state',
-                    success_state='available',
-                    erred_state='error'
-                )
+                _VOLUME_AVAILABLE_POLL(serialized_volume)
             )
 
         return chain(
-            core_tasks.StateTransitionTask().si(
+            _STATE.si(
                 core_utils.serialize_instance(volume.instance),
                 state_transition='begin_updating'
             ),
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_volume,
                 backend_method='detach_volume',
                 state_transition='begin_updating'
             ),
-            core_tasks.PollRuntimeStateTask().si(
-                serialized_volume,
-                backend_pull_method='pull_volume_runtime_state',
-                success_state='available',
-                erred_state='error'
-            ),
-            core_tasks.BackendMethodTask().si(
+            _VOLUME_AVAILABLE_POLL(serialized_volume),
+            _BACKEND.si(
                 serialized_volume,
                 backend_method='extend_volume',
             ),
-            core_tasks.PollRuntimeStateTask().si(
-                serialized_volume,
-                backend_pull_method='pull_volume_runtime_state',
-                success_state='available',
-                erred_state='error'
-            ),
-            core_tasks.BackendMethodTask().si(
+            _VOLUME_AVAILABLE_POLL(serialized_volume),
+            _BACKEND.si(
                 serialized_volume,
                 instance_uuid=volume.instance.uuid.hex,
                 device=volume.device,
                 backend_method='attach_volume',
             ),
-            core_tasks.PollRuntimeStateTask().si(
+            _POLL_BACKOFF.si(
                 serialized_volume,
                 backend_pull_method='pull_volume_runtime_state',
                 success_state='in-use',
-                erred_state='error'
+                erred_state='error',
+                initial_delay=1,
+                max_delay=30,
             ),
         )
 
@@ -169,21 +169,20 @@ class VolumeAttachExecutor(core_executors.ActionExecutor):
     @classmethod
     def get_task_signature(cls, volume, serialized_volume, **kwargs):
         return chain(
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_volume,
                 instance_uuid=volume.instance.uuid.hex,
                 device=volume.device,
                 backend_method='attach_volume',
                 state_transition='begin_updating'
             ),
-            core_tasks.PollRuntimeStateTask().si(
+            # field "device" is populated from the same response as runtime state.
+            _POLL.si(
                 serialized_volume,
-                backend_pull_method='pull_volume_runtime_state',
+                backend_pull_method='pull_attached_volume_runtime_state',
                 success_state='in-use',
                 erred_state='error',
             ),
-            # additional pull to populate field "device".
-            core_tasks.BackendMethodTask().si(serialized_volume, backend_method='pull_volume'),
         )
 
 
@@ -197,14 +196,9 @@ class VolumeDetachExecutor(core_executors.ActionExecutor):
     @classmethod
     def get_task_signature(cls, volume, serialized_volume, **kwargs):
         return chain(
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_volume, backend_method='detach_volume', state_transition='begin_updating'),
-            core_tasks.PollRuntimeStateTask().si(
-                serialized_volume,
-                backend_pull_method='pull_volume_runtime_state',
-                success_state='available',
-                erred_state='error',
-            )
+            _VOLUME_AVAILABLE_POLL(serialized_volume)
         )
 
 
@@ -213,12 +207,12 @@ class SnapshotCreateExecutor(core_executors.CreateExecutor):
     @classmethod
     def get_task_signature(cls, snapshot, serialized_snapshot, **kwargs):
         return chain(
-            tasks.ThrottleProvisionTask().si(
+            _THROTTLE.si(
                 serialized_snapshot,
                 'create_snapshot',
                 state_transition='begin_creating'
             ),
-            core_tasks.PollRuntimeStateTask().si(
+            _POLL.si(
                 serialized_snapshot,
                 backend_pull_method='pull_snapshot_runtime_state',
                 success_state='available',
@@ -234,10 +228,10 @@ class SnapshotUpdateExecutor(core_executors.UpdateExecutor):
         updated_fields = kwargs['updated_fields']
         # TODO: call separate task on metadata update
         if 'name' in updated_fields or 'description' in updated_fields:
-            return core_tasks.BackendMethodTask().si(
+            return _BACKEND.si(
                 serialized_snapshot, 'update_snapshot', state_transition='begin_updating')
         else:
-            return core_tasks.StateTransitionTask().si(serialized_snapshot, state_transition='begin_updating')
+            return _STATE.si(serialized_snapshot, state_transition='begin_updating')
 
 
 class SnapshotDeleteExecutor(core_executors.DeleteExecutor):
@@ -246,12 +240,12 @@ class SnapshotDeleteExecutor(core_executors.DeleteExecutor):
     def get_task_signature(cls, snapshot, serialized_snapshot, **kwargs):
         if snapshot.backend_id:
             return chain(
-                core_tasks.BackendMethodTask().si(
+                _BACKEND.si(
                     serialized_snapshot, 'delete_snapshot', state_transition='begin_deleting'),
-                core_tasks.PollBackendCheckTask().si(serialized_snapshot, 'is_snapshot_deleted'),
+                _POLL_CHECK.si(serialized_snapshot, 'is_snapshot_deleted'),
             )
         else:
-            return core_tasks.StateTransitionTask().si(serialized_snapshot, state_transition='begin_deleting')
+            return _STATE.si(serialized_snapshot, state_transition='begin_deleting')
 
 
 class SnapshotPullExecutor(core_executors.ActionExecutor):
@@ -259,7 +253,7 @@ class SnapshotPullExecutor(core_executors.ActionExecutor):
 
     @classmethod
     def get_task_signature(cls, snapshot, serialized_snapshot, **kwargs):
-        return core_tasks.BackendMethodTask().si(
+        return _BACKEND.si(
             serialized_snapshot, 'pull_snapshot',
             state_transition='begin_updating')
 
@@ -275,20 +269,15 @@ class InstanceCreateExecutor(core_executors.CreateExecutor):
         _tasks = [tasks.ThrottleProvisionStateTask().si(serialized_instance, state_transition='begin_creating')]
         # Create volumes
         for serialized_volume in serialized_volumes:
-            _tasks.append(tasks.ThrottleProvisionTask().si(
+            _tasks.append(_THROTTLE.si(
                 serialized_volume, 'create_volume', state_transition='begin_creating'))
-        for index, serialized_volume in enumerate(serialized_volumes):
+        for serialized_volume in serialized_volumes:
             # Wait for volume creation
-            _tasks.append(core_tasks.PollRuntimeStateTask().si(
-                serialized_volume,
-                backend_pull_method='pull_volume_runtime_state',
-                success_state='available',
-                erred_state='error',
-            ).set(countdown=30 if index == 0 else 0))
+            _tasks.append(_VOLUME_AVAILABLE_POLL(serialized_volume))
             # Pull volume to sure that it is bootable
-            _tasks.append(core_tasks.BackendMethodTask().si(serialized_volume, 'pull_volume'))
+            _tasks.append(_BACKEND.si(serialized_volume, 'pull_volume'))
             # Mark volume as OK
-            _tasks.append(core_tasks.StateTransitionTask().si(serialized_volume, state_transition='set_ok'))
+            _tasks.append(_STATE.si(serialized_volume, state_transition='set_ok'))
         # Create instance based on volumes
         kwargs = {
             'backend_flavor_id': flavor.backend_id,
@@ -296,11 +285,11 @@ class InstanceCreateExecutor(core_executors.CreateExecutor):
         if ssh_key is not None:
             kwargs['public_key'] = ssh_key.public_key
         # Wait 10 seconds after volume creation due to OpenStack restrictions.
-        _tasks.append(core_tasks.BackendMethodTask().si(
+        _tasks.append(_BACKEND.si(
             serialized_instance, 'create_instance', **kwargs).set(countdown=10))
 
         # Wait for instance creation
-        _tasks.append(core_tasks.PollRuntimeStateTask().si(
+        _tasks.append(_POLL.si(
             serialized_instance,
             backend_pull_method='pull_instance_runtime_state',
             success_state=models.Instance.RuntimeStates.ACTIVE,
@@ -308,30 +297,29 @@ class InstanceCreateExecutor(core_executors.CreateExecutor):
         ))
 
         # Update volumes runtime state and device name
-        for serialized_volume in serialized_volumes:
-            _tasks.append(core_tasks.BackendMethodTask().si(
-                serialized_volume,
-                backend_method='pull_volume',
-                update_fields=['runtime_state', 'device']
-            ))
+        _tasks.append(_BACKEND.si(
+            serialized_instance,
+            backend_method='pull_instance_volumes',
+            update_fields=['runtime_state', 'device']
+        ))
 
         # Pull instance internal IPs
         # pull_instance_internal_ips method cannot be used, because it requires backend_id to update
         # existing internal IPs. However, internal IPs of the created instance does not have backend_ids.
-        _tasks.append(core_tasks.BackendMethodTask().si(serialized_instance, 'pull_created_instance_internal_ips'))
+        _tasks.append(_BACKEND.si(serialized_instance, 'pull_created_instance_internal_ips'))
 
         # Pull instance security groups
-        _tasks.append(core_tasks.BackendMethodTask().si(serialized_instance, 'pull_instance_security_groups'))
+        _tasks.append(_BACKEND.si(serialized_instance, 'pull_instance_security_groups'))
 
         # Create non-existing floating IPs
         for floating_ip in instance.floating_ips.filter(backend_id=''):
             serialized_floating_ip = core_utils.serialize_instance(floating_ip)
-            _tasks.append(core_tasks.BackendMethodTask().si(serialized_floating_ip, 'create_floating_ip'))
+            _tasks.append(_BACKEND.si(serialized_floating_ip, 'create_floating_ip'))
         # Push instance floating IPs
-        _tasks.append(core_tasks.BackendMethodTask().si(serialized_instance, 'push_instance_floating_ips'))
+        _tasks.append(_BACKEND.si(serialized_instance, 'push_instance_floating_ips'))
         # Wait for operation completion
         for index, floating_ip in enumerate(instance.floating_ips):
-            _tasks.append(core_tasks.PollRuntimeStateTask().si(
+            _tasks.append(_POLL.si(
                 core_utils.serialize_instance(floating_ip),
                 backend_pull_method='pull_floating_ip_runtime_state',
                 success_state='ACTIVE',
@@ -360,10 +348,10 @@ class InstanceUpdateExecutor(core_executors.UpdateExecutor):
     def get_task_signature(cls, instance, serialized_instance, **kwargs):
         updated_fields = kwargs['updated_fields']
         if 'name' in updated_fields:
-            return core_tasks.BackendMethodTask().si(
+            return _BACKEND.si(
                 serialized_instance, 'update_instance', state_transition='begin_updating')
         else:
-            return core_tasks.StateTransitionTask().si(serialized_instance, state_transition='begin_updating')
+            return _STATE.si(serialized_instance, state_transition='begin_updating')
 
 
 class InstanceUpdateSecurityGroupsExecutor(core_executors.ActionExecutor):
@@ -371,7 +359,7 @@ class InstanceUpdateSecurityGroupsExecutor(core_executors.ActionExecutor):
 
     @classmethod
     def get_task_signature(cls, instance, serialized_instance, **kwargs):
-        return core_tasks.BackendMethodTask().si(
+        return _BACKEND.si(
             serialized_instance,
             backend_method='push_instance_security_groups',
             state_transition='begin_updating',
@@ -382,51 +370,50 @@ class InstanceDeleteExecutor(core_executors.DeleteExecutor):
 
     @classmethod
     def get_task_signature(cls, instance, serialized_instance, force=False, **kwargs):
-        delete_volumes = kwargs.pop('delete_volumes', True)
-        release_floating_ips = kwargs.pop('release_floating_ips', True)
-        delete_instance = cls.get_delete_instance_tasks(instance, serialized_instance, release_floating_ips)
-
         # Case 1. Instance does not exist at backend
         if not instance.backend_id:
-            return core_tasks.StateTransitionTask().si(
+            return _STATE.si(
                 serialized_instance,
                 state_transition='begin_deleting'
             )
 
+        delete_volumes = kwargs.pop('delete_volumes', True)
+        release_floating_ips = kwargs.pop('release_floating_ips', True)
+        delete_instance = cls.get_delete_instance_tasks(instance, serialized_instance, release_floating_ips)
+
         # Case 2. Instance exists at backend.
         # Data volumes are deleted by OpenStack because delete_on_termination=True
-        elif delete_volumes:
+        if delete_volumes:
             return chain(delete_instance)
 
         # Case 3. Instance exists at backend.
         # Data volumes are detached and not deleted.
-        else:
-            detach_volumes = cls.get_detach_data_volumes_tasks(instance, serialized_instance)
-            return chain(detach_volumes + delete_instance)
+        detach_volumes = cls.get_detach_data_volumes_tasks(instance, serialized_instance)
+        return chain(detach_volumes + delete_instance)
 
     @classmethod
     def get_delete_instance_tasks(cls, instance, serialized_instance, release_floating_ips):
         _tasks = [
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_instance,
                 backend_method='delete_instance',
                 state_transition='begin_deleting',
             ),
-            core_tasks.PollBackendCheckTask().si(
+            _POLL_CHECK.si(
                 serialized_instance,
                 backend_check_method='is_instance_deleted',
             ),
         ]
         if release_floating_ips:
             for index, floating_ip in enumerate(instance.floating_ips):
-                _tasks.append(core_tasks.BackendMethodTask().si(
+                _tasks.append(_BACKEND.si(
                     core_utils.serialize_instance(floating_ip),
                     'delete_floating_ip',
                 ).set(countdown=5 if not index else 0))
         else:
             # pull related floating IPs state after instance deletion
             for index, floating_ip in enumerate(instance.floating_ips):
-                _tasks.append(core_tasks.BackendMethodTask().si(
+                _tasks.append(_BACKEND.si(
                     core_utils.serialize_instance(floating_ip),
                     'pull_floating_ip_runtime_state',
                 ).set(countdown=5 if not index else 0))
@@ -441,22 +428,18 @@ class InstanceDeleteExecutor(core_executors.DeleteExecutor):
 
     @classmethod
     def get_detach_data_volumes_tasks(cls, instance, serialized_instance):
-        data_volumes = instance.volumes.all().filter(bootable=False)
+        serialized_volumes = [core_utils.serialize_instance(volume)
+                              for volume in instance.volumes.filter(bootable=False)]
         detach_volumes = [
-            core_tasks.BackendMethodTask().si(
-                core_utils.serialize_instance(volume),
+            _BACKEND.si(
+                serialized_volume,
                 backend_method='detach_volume',
             )
-            for volume in data_volumes
+            for serialized_volume in serialized_volumes
         ]
         check_volumes = [
-            core_tasks.PollRuntimeStateTask().si(
-                core_utils.serialize_instance(volume),
-                backend_pull_method='pull_volume_runtime_state',
-                success_state='available',
-                erred_state='error'
-            )
-            for volume in data_volumes
+            _VOLUME_AVAILABLE_POLL(serialized_volume)
+            for serialized_volume in serialized_volumes
         ]
         return detach_volumes + check_volumes
 
@@ -478,23 +461,23 @@ class InstanceFlavorChangeExecutor(core_executors.ActionExecutor):
     def get_task_signature(cls, instance, serialized_instance, **kwargs):
         flavor = kwargs.pop('flavor')
         return chain(
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_instance,
                 backend_method='resize_instance',
                 state_transition='begin_updating',
                 flavor_id=flavor.backend_id
             ),
-            core_tasks.PollRuntimeStateTask().si(
+            _POLL.si(
                 serialized_instance,
                 backend_pull_method='pull_instance_runtime_state',
                 success_state='VERIFY_RESIZE',
                 erred_state='ERRED'
             ),
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_instance,
                 backend_method='confirm_instance_resize'
             ),
-            core_tasks.PollRuntimeStateTask().si(
+            _POLL.si(
                 serialized_instance,
                 backend_pull_method='pull_instance_runtime_state',
                 success_state='SHUTOFF',
@@ -509,12 +492,12 @@ class InstancePullExecutor(core_executors.ActionExecutor):
     @classmethod
     def get_task_signature(cls, instance, serialized_instance, **kwargs):
         return chain(
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_instance, 'pull_instance', state_transition='begin_updating',
             ),
-            core_tasks.BackendMethodTask().si(serialized_instance, 'pull_instance_security_groups'),
-            core_tasks.BackendMethodTask().si(serialized_instance, 'pull_instance_internal_ips'),
-            core_tasks.BackendMethodTask().si(serialized_instance, 'pull_instance_floating_ips'),
+            _BACKEND.si(serialized_instance, 'pull_instance_security_groups'),
+            _BACKEND.si(serialized_instance, 'pull_instance_internal_ips'),
+            _BACKEND.si(serialized_instance, 'pull_instance_floating_ips'),
         )
 
 
@@ -544,16 +527,16 @@ class InstanceFloatingIPsUpdateExecutor(core_executors.ActionExecutor):
 
     @classmethod
     def get_task_signature(cls, instance, serialized_instance, **kwargs):
-        _tasks = [core_tasks.StateTransitionTask().si(serialized_instance, state_transition='begin_updating')]
+        _tasks = [_STATE.si(serialized_instance, state_transition='begin_updating')]
         # Create non-exist floating IPs
         for floating_ip in instance.floating_ips.filter(backend_id=''):
             serialized_floating_ip = core_utils.serialize_instance(floating_ip)
-            _tasks.append(core_tasks.BackendMethodTask().si(serialized_floating_ip, 'create_floating_ip'))
+            _tasks.append(_BACKEND.si(serialized_floating_ip, 'create_floating_ip'))
         # Push instance floating IPs
-        _tasks.append(core_tasks.BackendMethodTask().si(serialized_instance, 'push_instance_floating_ips'))
+        _tasks.append(_BACKEND.si(serialized_instance, 'push_instance_floating_ips'))
         # Wait for operation completion
         for index, floating_ip in enumerate(instance.floating_ips):
-            _tasks.append(core_tasks.PollRuntimeStateTask().si(
+            _tasks.append(_POLL.si(
                 core_utils.serialize_instance(floating_ip),
                 backend_pull_method='pull_floating_ip_runtime_state',
                 success_state='ACTIVE',
@@ -578,10 +561,10 @@ class InstanceStopExecutor(core_executors.ActionExecutor):
     @classmethod
     def get_task_signature(cls, instance, serialized_instance, **kwargs):
         return chain(
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_instance, 'stop_instance', state_transition='begin_updating',
             ),
-            core_tasks.PollRuntimeStateTask().si(
+            _POLL.si(
                 serialized_instance,
                 backend_pull_method='pull_instance_runtime_state',
                 success_state='SHUTOFF',
@@ -596,10 +579,10 @@ class InstanceStartExecutor(core_executors.ActionExecutor):
     @classmethod
     def get_task_signature(cls, instance, serialized_instance, **kwargs):
         return chain(
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_instance, 'start_instance', state_transition='begin_updating',
             ),
-            core_tasks.PollRuntimeStateTask().si(
+            _POLL.si(
                 serialized_instance,
                 backend_pull_method='pull_instance_runtime_state',
                 success_state='ACTIVE',
@@ -614,10 +597,10 @@ class InstanceRestartExecutor(core_executors.ActionExecutor):
     @classmethod
     def get_task_signature(cls, instance, serialized_instance, **kwargs):
         return chain(
-            core_tasks.BackendMethodTask().si(
+            _BACKEND.si(
                 serialized_instance, 'restart_instance', state_transition='begin_updating',
             ),
-            core_tasks.PollRuntimeStateTask().si(
+            _POLL.si(
                 serialized_instance,
                 backend_pull_method='pull_instance_runtime_state',
                 success_state='ACTIVE',
@@ -631,7 +614,7 @@ class InstanceInternalIPsSetUpdateExecutor(core_executors.ActionExecutor):
 
     @classmethod
     def get_task_signature(cls, instance, serialized_instance, **kwargs):
-        return core_tasks.BackendMethodTask().si(
+        return _BACKEND.si(
             serialized_instance, 'push_instance_internal_ips', state_transition='begin_updating',
         )
 
@@ -642,18 +625,18 @@ class BackupCreateExecutor(core_executors.CreateExecutor):
     def get_task_signature(cls, backup, serialized_backup, **kwargs):
         serialized_snapshots = [core_utils.serialize_instance(snapshot) for snapshot in backup.snapshots.all()]
 
-        _tasks = [core_tasks.StateTransitionTask().si(serialized_backup, state_transition='begin_creating')]
+        _tasks = [_STATE.si(serialized_backup, state_transition='begin_creating')]
         for serialized_snapshot in serialized_snapshots:
-            _tasks.append(tasks.ThrottleProvisionTask().si(
+            _tasks.append(_THROTTLE.si(
                 serialized_snapshot, 'create_snapshot', force=True, state_transition='begin_creating'))
         for index, serialized_snapshot in enumerate(serialized_snapshots):
-            _tasks.append(core_tasks.PollRuntimeStateTask().si(
+            _tasks.append(_POLL.si(
                 serialized_snapshot,
                 backend_pull_method='pull_snapshot_runtime_state',
                 success_state='available',
                 erred_state='error',
             ).set(countdown=10 if index == 0 else 0))
-            _tasks.append(core_tasks.StateTransitionTask().si(serialized_snapshot, state_transition='set_ok'))
+            _tasks.append(_STATE.si(serialized_snapshot, state_transition='set_ok'))
 
         return chain(*_tasks)
 
@@ -675,12 +658,12 @@ class BackupDeleteExecutor(core_executors.DeleteExecutor):
     def get_task_signature(cls, backup, serialized_backup, force=False, **kwargs):
         serialized_snapshots = [core_utils.serialize_instance(snapshot) for snapshot in backup.snapshots.all()]
 
-        _tasks = [core_tasks.StateTransitionTask().si(serialized_backup, state_transition='begin_deleting')]
+        _tasks = [_STATE.si(serialized_backup, state_transition='begin_deleting')]
         for serialized_snapshot in serialized_snapshots:
-            _tasks.append(core_tasks.BackendMethodTask().si(
+            _tasks.append(_BACKEND.si(
                 serialized_snapshot, 'delete_snapshot', state_transition='begin_deleting'))
         for serialized_snapshot in serialized_snapshots:
-            _tasks.append(core_tasks.PollBackendCheckTask().si(serialized_snapshot, 'is_snapshot_deleted'))
+            _tasks.append(_POLL_CHECK.si(serialized_snapshot, 'is_snapshot_deleted'))
             _tasks.append(core_tasks.DeletionTask().si(serialized_snapshot))
 
         return chain(*_tasks)
@@ -701,13 +684,11 @@ class SnapshotRestorationExecutor(core_executors.CreateExecutor):
         serialized_volume = core_utils.serialize_instance(snapshot_restoration.volume)
 
         _tasks = [
-            tasks.ThrottleProvisionTask().si(
+            _THROTTLE.si(
                 serialized_volume, 'create_volume', state_transition='begin_creating'),
-            core_tasks.PollRuntimeStateTask().si(
-                serialized_volume, 'pull_volume_runtime_state', success_state='available', erred_state='error',
-            ).set(countdown=30),
-            core_tasks.BackendMethodTask().si(serialized_volume, 'remove_bootable_flag'),
-            core_tasks.BackendMethodTask().si(serialized_volume, 'pull_volume'),
+            _VOLUME_AVAILABLE_POLL(serialized_volume),
+            _BACKEND.si(serialized_volume, 'remove_bootable_flag'),
+            _BACKEND.si(serialized_volume, 'pull_volume'),
         ]
 
         return chain(*_tasks)
@@ -715,12 +696,12 @@ class SnapshotRestorationExecutor(core_executors.CreateExecutor):
     @classmethod
     def get_success_signature(cls, snapshot_restoration, serialized_snapshot_restoration, **kwargs):
         serialized_volume = core_utils.serialize_instance(snapshot_restoration.volume)
-        return core_tasks.StateTransitionTask().si(serialized_volume, state_transition='set_ok')
+        return _STATE.si(serialized_volume, state_transition='set_ok')
 
     @classmethod
     def get_failure_signature(cls, snapshot_restoration, serialized_snapshot_restoration, **kwargs):
         serialized_volume = core_utils.serialize_instance(snapshot_restoration.volume)
-        return core_tasks.StateTransitionTask().si(serialized_volume, state_transition='set_erred')
+        return _STATE.si(serialized_volume, state_transition='set_erred')
 
 
 class OpenStackTenantCleanupExecutor(structure_executors.BaseCleanupExecutor):
@@ -246,6 +246,11 @@ class VolumeSerializer(structure_serializers.BaseResourceSerializer):
             **structure_serializers.BaseResourceSerializer.Meta.extra_kwargs
         )
 
+    @staticmethod
+    def eager_load(queryset):
+        queryset = structure_serializers.BaseResourceSerializer.eager_load(queryset)
+        return queryset.select_related('instance', 'image', 'source_snapshot')
+
     def get_instance_name(self, volume):
         if volume.instance:
             return volume.instance.name
@@ -257,7 +262,7 @@ class VolumeSerializer(structure_serializers.BaseResourceSerializer):
             # image validation
             image = attrs.get('image')
             spl = attrs['service_project_link']
-            if image and image.settings != spl.service.settings:
+            if image and image.settings_id != spl.service.settings_id:
                 raise serializers.ValidationError({'image': _('Image must belong to the same service settings')})
             # snapshot & size validation
             size = attrs.get('size')
@@ -425,6 +430,11 @@ class SnapshotSerializer(structure_serializers.BaseResourceSerializer):
             **structure_serializers.BaseResourceSerializer.Meta.extra_kwargs
         )
 
+    @staticmethod
+    def eager_load(queryset):
+        queryset = structure_serializers.BaseResourceSerializer.eager_load(queryset)
+        return queryset.select_related('source_volume', 'snapshot_schedule').prefetch_related('restorations__volume')
+
     def validate(self, attrs):
         # Skip validation on update
         if self.instance:
@@ -512,7 +522,7 @@ class NestedVolumeSerializer(core_serializers.AugmentedSerializerMixin,
         }
 
 
-class NestedSecurityGroupRuleSerializer(serializers.ModelSerializer):
+class NestedSecurityGroupRuleSerializer(openstack_serializers.FieldsCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = models.SecurityGroupRule
         fields = ('id', 'protocol', 'from_port', 'to_port', 'cidr')
@@ -765,12 +775,10 @@ class InstanceSerializer(structure_serializers.VirtualMachineSerializer):
         if self.instance is not None:
             return attrs
 
-        service_project_link = attrs['service_project_link']
-        settings = service_project_link.service.settings
-        flavor = attrs['flavor']
-        image = attrs['image']
+        settings = attrs['service_project_link'].service.settings
+        flavor, image = attrs['flavor'], attrs['image']
 
-        if any([flavor.settings != settings, image.settings != settings]):
+        if flavor.settings != settings or image.settings != settings:
             raise serializers.ValidationError(
                 _('Flavor and image must belong to the same service settings as service project link.'))
 
@@ -881,17 +889,17 @@ class InstanceFlavorChangeSerializer(structure_serializers.PermissionFieldFilter
 
     def validate_flavor(self, value):
         if value is not None:
-            spl = self.instance.service_project_link
+            instance = self.instance
 
-            if value.name == self.instance.flavor_name:
+            if value.name == instance.flavor_name:
                 raise serializers.ValidationError(
                     _('New flavor is the same as current.'))
 
-            if value.settings != spl.service.settings:
+            if value.settings != instance.service_project_link.service.settings:
                 raise serializers.ValidationError(
                     _('New flavor is not within the same service settings'))
 
-            if value.disk < self.instance.flavor_disk:
+            if value.disk < instance.flavor_disk:
                 raise serializers.ValidationError(
                     _('New flavor disk should be greater than the previous value'))
         return value
@@ -956,8 +964,7 @@ class InstanceSecurityGroupsUpdateSerializer(serializers.Serializer):
     def update(self, instance, validated_data):
         security_groups = validated_data.pop('security_groups', None)
         if security_groups is not None:
-            instance.security_groups.clear()
-            instance.security_groups.add(*security_groups)
+            instance.security_groups.set(security_groups)
 
         return instance
 
@@ -1070,10 +1077,10 @@ class BackupRestorationSerializer(serializers.HyperlinkedModelSerializer):
             fields['flavor'].display_name_field = 'name'
             fields['flavor'].view_name = 'openstacktenant-flavor-detail'
             # It is assumed that valid OpenStack Instance has exactly one bootable volume
-            system_volume = backup.instance.volumes.get(bootable=True)
+            system_volume_size = backup.instance.volumes.values_list('size', flat=True).get(bootable=True)
             fields['flavor'].query_params = {
-                'settings_uuid': backup.service_project_link.service.settings.uuid,
-                'disk__gte': system_volume.size,
+                'settings_uuid': settings.uuid,
+                'disk__gte': system_volume_size,
             }
 
             floating_ip_field = fields.get('floating_ips')
@@ -1107,12 +1114,12 @@ class BackupRestorationSerializer(serializers.HyperlinkedModelSerializer):
     def validate(self, attrs):
         flavor = attrs['flavor']
         backup = self.context['view'].get_object()
-        system_volume = backup.instance.volumes.get(bootable=True)
+        system_volume_size = backup.instance.volumes.values_list('size', flat=True).get(bootable=True)
         settings = backup.instance.service_project_link.service.settings
 
-        if flavor.settings != settings:
+        if flavor.settings_id != settings.id:
             raise serializers.ValidationError({'flavor': _('Flavor is not within services\' settings.')})
-        if flavor.disk < system_volume.size:
+        if flavor.disk < system_volume_size:
             raise serializers.ValidationError({'flavor': _('Flavor disk size should match system volume size.')})
 
         _validate_instance_security_groups(attrs.get('security_groups', []), settings)
@@ -1130,6 +1137,7 @@ class BackupRestorationSerializer(serializers.HyperlinkedModelSerializer):
         flavor = validated_data['flavor']
         validated_data['backup'] = backup = backup_instance
         source_instance = backup.instance
+        snapshots = list(backup.snapshots.all())
         # instance that will be restored
         metadata = backup.metadata or {}
         instance = models.Instance.objects.create(
@@ -1146,7 +1154,7 @@ class BackupRestorationSerializer(serializers.HyperlinkedModelSerializer):
             min_disk=metadata.get('min_disk', 0),
             image_name=metadata.get('image_name', ''),
             user_data=metadata.get('user_data', ''),
-            disk=sum([snapshot.size for snapshot in backup.snapshots.all()]),
+            disk=sum([snapshot.size for snapshot in snapshots]),
         )
 
         instance.internal_ips_set.add(*validated_data.pop('internal_ips_set', []), bulk=False)
@@ -1159,7 +1167,8 @@ class BackupRestorationSerializer(serializers.HyperlinkedModelSerializer):
         validated_data['instance'] = instance
         backup_restoration = super(BackupRestorationSerializer, self).create(validated_data)
         # restoration for each instance volume from snapshot.
-        for snapshot in backup.snapshots.all():
+        volumes = []
+        for snapshot in snapshots:
             volume = models.Volume(
                 source_snapshot=snapshot,
                 service_project_link=snapshot.service_project_link,
@@ -1171,7 +1180,8 @@ class BackupRestorationSerializer(serializers.HyperlinkedModelSerializer):
                 volume.image_metadata = snapshot.metadata['source_volume_image_metadata']
             volume.save()
             volume.increase_backend_quotas_usage()
-            instance.volumes.add(volume)
+            volumes.append(volume)
+        instance.volumes.add(*volumes)
         return backup_restoration
 
 
@@ -1245,6 +1255,7 @@ class BackupSerializer(structure_serializers.BaseResourceSerializer):
 
     @staticmethod
     def create_backup_snapshots(backup):
+        snapshots = []
         for volume in backup.instance.volumes.all():
             snapshot = models.Snapshot.objects.create(
                 name='Part of backup: %s (volume: %s)' % (backup.name[:60], volume.name[:60]),
@@ -1255,11 +1266,15 @@ class BackupSerializer(structure_serializers.BaseResourceSerializer):
                 metadata=SnapshotSerializer.get_snapshot_metadata(volume),
             )
             snapshot.increase_backend_quotas_usage()
-            backup.snapshots.add(snapshot)
+            snapshots.append(snapshot)
+        backup.snapshots.add(*snapshots)
+
+
+TIMEZONE_CHOICES = tuple((t, t) for t in pytz.all_timezones)
 
 
 class BaseScheduleSerializer(structure_serializers.BaseResourceSerializer):
-    timezone = serializers.ChoiceField(choices=[(t, t) for t in pytz.all_timezones],
+    timezone = serializers.ChoiceField(choices=TIMEZONE_CHOICES,
                                        initial=timezone.get_current_timezone_name(),
                                        default=timezone.get_current_timezone_name())
     service = serializers.HyperlinkedRelatedField(
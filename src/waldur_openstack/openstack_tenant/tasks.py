@@ -41,11 +41,9 @@ class SetInstanceErredTask(core_tasks.ErrorStateTransitionTask):
         # delete volumes if they were not created on backend,
         # mark as erred if creation was started, but not ended,
         # leave as is, if they are OK.
-        for volume in instance.volumes.all():
+        for volume in instance.volumes.exclude(state=models.Volume.States.OK):
             if volume.state == models.Volume.States.CREATION_SCHEDULED:
                 volume.delete()
-            elif volume.state == models.Volume.States.OK:
-                pass
             else:
                 volume.set_erred()
                 volume.save(update_fields=['state'])
@@ -94,6 +92,20 @@ class VolumeExtendErredTask(core_tasks.ErrorStateTransitionTask):
             super(VolumeExtendErredTask, self).execute(volume.instance)
 
 
+class PollRuntimeStateBackoffTask(core_tasks.PollRuntimeStateTask):
+    """ Poll runtime state doubling delay between attempts from initial_delay up to max_delay """
+    max_retries = 60
+
+    def pre_execute(self, instance):
+        self.initial_delay = self.kwargs.pop('initial_delay', 1)
+        self.max_delay = self.kwargs.pop('max_delay', 30)
+        super(PollRuntimeStateBackoffTask, self).pre_execute(instance)
+
+    def retry(self, *args, **kwargs):
+        kwargs.setdefault('countdown', min(self.initial_delay * 2 ** self.request.retries, self.max_delay))
+        return super(PollRuntimeStateBackoffTask, self).retry(*args, **kwargs)
+
+
 class BaseScheduleTask(core_tasks.BackgroundTask):
     model = NotImplemented
     resource_attribute = NotImplemented
@@ -1,6 +1,8 @@
 from __future__ import unicode_literals
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from cinderclient.v2.volumes import Volume
 from novaclient.v2.servers import Server
 from novaclient.v2.flavors import Flavor
@@ -11,6 +13,24 @@ from waldur_openstack.openstack_tenant import models
 
 from .. import fixtures, factories
 
+BACKEND_FLOATING_IP_TEMPLATE = {
+    'floating_ip_address': '0.0.0.0',
+    'floating_network_id': 'new_backend_network_id',
+    'status': 'DOWN',
+    'id': 'new_backend_id',
+    'port_id': None,
+}
+
+
+class FakeNeutronClient(object):
+    """ Minimal neutron client stub that returns preset floating IPs. """
+
+    def __init__(self):
+        self.floatingips = []
+
+    def list_floatingips(self, **kwargs):
+        return {'floatingips': self.floatingips}
+
 
 class BaseBackendTest(TestCase):
     def setUp(self):
@@ -57,63 +77,75 @@ class BaseBackendTest(TestCase):
         ))
 
 
-class PullFloatingIPTest(BaseBackendTest):
+class PullFloatingIPTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.fixture = fixtures.OpenStackTenantFixture()
+        cls.settings = cls.fixture.openstack_tenant_service_settings
+        cls.tenant = cls.fixture.openstack_tenant_service_settings.scope
+        # Fixture objects are created lazily, so create them here,
+        # otherwise they are created in the first test and rolled back after it.
+        cls.fixture.instance
+        cls.fixture.subnet
+        cls.internal_ip = factories.InternalIPFactory(instance=cls.fixture.instance)
+        cls.backend_floating_ips = cls._get_valid_new_backend_ip(cls.internal_ip)
 
-    def _get_valid_new_backend_ip(self, internal_ip):
-        return dict(floatingips=[{
-            'floating_ip_address': '0.0.0.0',
-            'floating_network_id': 'new_backend_network_id',
-            'status': 'DOWN',
-            'id': 'new_backend_id',
-            'port_id': internal_ip.backend_id
-        }])
+    def setUp(self):
+        self.tenant_backend = OpenStackTenantBackend(self.settings)
+        self.neutron_client = FakeNeutronClient()
+        self.tenant_backend.neutron_client = self.neutron_client
+
+    @staticmethod
+    def _get_valid_new_backend_ip(internal_ip):
+        return dict(floatingips=[dict(BACKEND_FLOATING_IP_TEMPLATE, port_id=internal_ip.backend_id)])
 
     def test_floating_ip_is_not_created_if_internal_ip_is_missing(self):
-        internal_ip = factories.InternalIPFactory(instance=self.fixture.instance)
-        backend_floating_ips = self._get_valid_new_backend_ip(internal_ip)
-        internal_ip.delete()
-        self.neutron_client_mock.list_floatingips.return_value = backend_floating_ips
-        self.assertEqual(models.FloatingIP.objects.count(), 0)
+        backend_floating_ips = self.backend_floating_ips
+        # Delete through queryset so that the shared instance keeps its pk.
+        models.InternalIP.objects.filter(pk=self.internal_ip.pk).delete()
+        self.neutron_client.floatingips = backend_floating_ips['floatingips']
+        self.assertFalse(models.FloatingIP.objects.exists())
 
         self.tenant_backend.pull_floating_ips()
 
-        self.assertEqual(models.FloatingIP.objects.count(), 0)
+        self.assertFalse(models.FloatingIP.objects.exists())
 
     def test_floating_ip_is_not_updated_if_internal_ip_is_missing(self):
-        internal_ip = factories.InternalIPFactory(instance=self.fixture.instance)
-        backend_floating_ips = self._get_valid_new_backend_ip(internal_ip)
-        internal_ip.delete()
-        self.neutron_client_mock.list_floatingips.return_value = backend_floating_ips
+        backend_floating_ips = self.backend_floating_ips
+        # Delete through queryset so that the shared instance keeps its pk.
+        models.InternalIP.objects.filter(pk=self.internal_ip.pk).delete()
+        self.neutron_client.floatingips = backend_floating_ips['floatingips']
         backend_ip = backend_floating_ips['floatingips'][0]
-        floating_ip = factories.FloatingIPFactory(settings=self.settings,
-                                                  backend_id=backend_ip['id'],
-                                                  name='old_name',
-                                                  runtime_state='old_status',
-                                                  backend_network_id='old_backend_network_id',
-                                                  address='127.0.0.1')
-        self.assertEqual(models.FloatingIP.objects.count(), 1)
+        floating_ip = models.FloatingIP.objects.create(settings=self.settings,
+                                                       backend_id=backend_ip['id'],
+                                                       name='old_name',
+                                                       runtime_state='old_status',
+                                                       backend_network_id='old_backend_network_id',
+                                                       address='127.0.0.1')
 
         self.tenant_backend.pull_floating_ips()
 
         self.assertEqual(models.FloatingIP.objects.count(), 1)
-        floating_ip.refresh_from_db()
-        self.assertNotEqual(floating_ip.address, backend_ip['floating_ip_address'])
-        self.assertNotEqual(floating_ip.name, backend_ip['floating_ip_address'])
-        self.assertNotEqual(floating_ip.runtime_state, backend_ip['status'])
-        self.assertNotEqual(floating_ip.backend_network_id, backend_ip['floating_network_id'])
+        row = models.FloatingIP.objects.filter(pk=floating_ip.pk).values(
+            'name', 'address', 'runtime_state', 'backend_network_id').get()
+        self.assertNotEqual(row['address'], backend_ip['floating_ip_address'])
+        self.assertNotEqual(row['name'], backend_ip['floating_ip_address'])
+        self.assertNotEqual(row['runtime_state'], backend_ip['status'])
+        self.assertNotEqual(row['backend_network_id'], backend_ip['floating_network_id'])
 
     def test_floating_ip_is_updated_if_internal_ip_exists_even_if_not_connected_to_instance(self):
         internal_ip = factories.InternalIPFactory(subnet=self.fixture.subnet)
         backend_floating_ips = self._get_valid_new_backend_ip(internal_ip)
-        self.neutron_client_mock.list_floatingips.return_value = backend_floating_ips
+        self.neutron_client.floatingips = backend_floating_ips['floatingips']
 
         backend_ip = backend_floating_ips['floatingips'][0]
-        floating_ip = factories.FloatingIPFactory(settings=self.settings,
-                                                  backend_id=backend_ip['id'],
-                                                  name='old_name',
-                                                  runtime_state='old_status',
-                                                  backend_network_id='old_backend_network_id',
-                                                  address='127.0.0.1')
+        floating_ip = models.FloatingIP.objects.create(settings=self.settings,
+                                                       backend_id=backend_ip['id'],
+                                                       name='old_name',
+                                                       runtime_state='old_status',
+                                                       backend_network_id='old_backend_network_id',
+                                                       address='127.0.0.1')
 
         self.tenant_backend.pull_floating_ips()
 
@@ -129,7 +161,7 @@ class PullFloatingIPTest(BaseBackendTest):
         internal_ip = factories.InternalIPFactory(subnet=self.fixture.subnet, instance=self.fixture.instance)
         backend_floating_ips = self._get_valid_new_backend_ip(internal_ip)
         backend_ip = backend_floating_ips['floatingips'][0]
-        self.neutron_client_mock.list_floatingips.return_value = backend_floating_ips
+        self.neutron_client.floatingips = backend_floating_ips['floatingips']
 
         self.tenant_backend.pull_floating_ips()
 
@@ -139,42 +171,75 @@ class PullFloatingIPTest(BaseBackendTest):
         self.assertEqual(created_ip.backend_network_id, backend_ip['floating_network_id'])
         self.assertEqual(created_ip.address, backend_ip['floating_ip_address'])
 
+    def _get_new_backend_ips(self, count):
+        return [
+            dict(BACKEND_FLOATING_IP_TEMPLATE,
+                 id='backend_id_%s' % i,
+                 floating_ip_address='10.0.%s.%s' % (i // 256, i % 256))
+            for i in range(count)
+        ]
+
+    def _get_floating_ip_inserts(self, queries):
+        table = models.FloatingIP._meta.db_table
+        return [query for query in queries
+                if query['sql'].startswith('INSERT INTO') and table in query['sql']]
+
+    def test_many_floating_ips_are_created_in_batches(self):
+        # pull_floating_ips inserts new floating IPs in batches of 100 rows.
+        self.neutron_client.floatingips = self._get_new_backend_ips(250)
+
+        with CaptureQueriesContext(connection) as context:
+            self.tenant_backend.pull_floating_ips()
+
+        self.assertEqual(len(self._get_floating_ip_inserts(context.captured_queries)), 3)
+        self.assertEqual(models.FloatingIP.objects.filter(settings=self.settings).count(), 250)
+
+    def test_number_of_queries_grows_only_with_number_of_insert_batches(self):
+        self.neutron_client.floatingips = self._get_new_backend_ips(1)
+        with CaptureQueriesContext(connection) as context:
+            self.tenant_backend.pull_floating_ips()
+        self.assertEqual(len(self._get_floating_ip_inserts(context.captured_queries)), 1)
+        models.FloatingIP.objects.all().delete()
+
+        # 250 new floating IPs need two more insert batches than a single one.
+        self.neutron_client.floatingips = self._get_new_backend_ips(250)
+        with self.assertNumQueries(len(context) + 2):
+            self.tenant_backend.pull_floating_ips()
+
     def test_floating_ip_is_deleted_if_it_is_not_returned_by_neutron(self):
         floating_ip = factories.FloatingIPFactory(settings=self.settings)
-        self.neutron_client_mock.list_floatingips.return_value = dict(floatingips=[])
+        self.neutron_client.floatingips = []
 
         self.tenant_backend.pull_floating_ips()
 
         self.assertFalse(models.FloatingIP.objects.filter(id=floating_ip.id).exists())
 
     def test_floating_ip_is_not_updated_if_it_is_in_booked_state(self):
-        internal_ip = factories.InternalIPFactory(instance=self.fixture.instance)
-        backend_floating_ips = self._get_valid_new_backend_ip(internal_ip)
-        self.neutron_client_mock.list_floatingips.return_value = backend_floating_ips
+        backend_floating_ips = self.backend_floating_ips
+        self.neutron_client.floatingips = backend_floating_ips['floatingips']
         backend_ip = backend_floating_ips['floatingips'][0]
         expected_name = 'booked ip'
         expected_address = '127.0.0.1'
         expected_runtime_state = 'booked_state'
-        booked_ip = factories.FloatingIPFactory(is_booked=True,
-                                                settings=self.settings,
-                                                backend_id=backend_ip['id'],
-                                                name=expected_name,
-                                                address=expected_address,
-                                                runtime_state=expected_runtime_state)
+        booked_ip = models.FloatingIP.objects.create(is_booked=True,
+                                                     settings=self.settings,
+                                                     backend_id=backend_ip['id'],
+                                                     name=expected_name,
+                                                     address=expected_address,
+                                                     runtime_state=expected_runtime_state)
 
         self.tenant_backend.pull_floating_ips()
 
-        booked_ip.refresh_from_db()
-        self.assertEqual(booked_ip.name, expected_name)
-        self.assertEqual(booked_ip.address, expected_address)
-        self.assertEqual(booked_ip.runtime_state, expected_runtime_state)
+        row = models.FloatingIP.objects.filter(pk=booked_ip.pk).values('name', 'address', 'runtime_state').get()
+        self.assertEqual(row['name'], expected_name)
+        self.assertEqual(row['address'], expected_address)
+        self.assertEqual(row['runtime_state'], expected_runtime_state)
 
     def test_floating_ip_is_not_duplicated_if_it_is_in_booked_state(self):
-        internal_ip = factories.InternalIPFactory(instance=self.fixture.instance)
-        backend_floating_ips = self._get_valid_new_backend_ip(internal_ip)
-        self.neutron_client_mock.list_floatingips.return_value = backend_floating_ips
+        backend_floating_ips = self.backend_floating_ips
+        self.neutron_client.floatingips = backend_floating_ips['floatingips']
         backend_ip = backend_floating_ips['floatingips'][0]
-        factories.FloatingIPFactory(
+        models.FloatingIP.objects.create(
             is_booked=True,
             settings=self.settings,
             backend_id=backend_ip['id'],
@@ -188,9 +253,8 @@ class PullFloatingIPTest(BaseBackendTest):
         self.assertEqual(models.FloatingIP.objects.filter(address=backend_ip_address).count(), 1)
 
     def test_floating_ip_name_is_not_update_if_it_was_set_by_user(self):
-        internal_ip = factories.InternalIPFactory(instance=self.fixture.instance)
-        backend_floating_ips = self._get_valid_new_backend_ip(internal_ip)
-        self.neutron_client_mock.list_floatingips.return_value = backend_floating_ips
+        backend_floating_ips = self.backend_floating_ips
+        self.neutron_client.floatingips = backend_floating_ips['floatingips']
         backend_ip = backend_floating_ips['floatingips'][0]
         expected_name = 'user defined ip'
         floating_ip = factories.FloatingIPFactory(
@@ -200,9 +264,9 @@ class PullFloatingIPTest(BaseBackendTest):
 
         self.tenant_backend.pull_floating_ips()
 
-        floating_ip.refresh_from_db()
-        self.assertNotEqual(floating_ip.address, floating_ip.name)
-        self.assertEqual(floating_ip.name, expected_name)
+        row = models.FloatingIP.objects.filter(pk=floating_ip.pk).values('name', 'address').get()
+        self.assertNotEqual(row['address'], row['name'])
+        self.assertEqual(row['name'], expected_name)
 
 
 class PullSecurityGroupsTest(BaseBackendTest):
@@ -449,6 +513,65 @@ class ImportVolumeTest(BaseBackendTest):
         self.assertEqual(volume.name, self.backend_volume.name)
 
 
+class PullInstanceVolumesTest(BaseBackendTest):
+
+    def setUp(self):
+        super(PullInstanceVolumesTest, self).setUp()
+        self.instance = self.fixture.instance
+        self.volume = self.fixture.volume
+        self.volume.instance = self.instance
+        self.volume.backend_id = 'volume_backend_id'
+        self.volume.runtime_state = 'available'
+        self.volume.save()
+
+        self.backend_volume = self._get_valid_volume(self.volume.backend_id)
+        self.backend_volume.status = 'in-use'
+        self.backend_volume.attachments = [dict(device='/dev/vdb')]
+        self.cinder_client_mock.volumes.list.return_value = [self.backend_volume]
+
+    def test_instance_volumes_are_pulled_with_single_request(self):
+        self.tenant_backend.pull_instance_volumes(self.instance, update_fields=['runtime_state', 'device'])
+
+        self.volume.refresh_from_db()
+        self.assertEqual(self.volume.runtime_state, 'in-use')
+        self.assertEqual(self.volume.device, '/dev/vdb')
+        self.assertEqual(self.cinder_client_mock.volumes.list.call_count, 1)
+
+    def test_volume_is_skipped_if_it_is_missing_in_backend(self):
+        self.cinder_client_mock.volumes.list.return_value = []
+
+        self.tenant_backend.pull_instance_volumes(self.instance, update_fields=['runtime_state', 'device'])
+
+        self.volume.refresh_from_db()
+        self.assertEqual(self.volume.runtime_state, 'available')
+
+
+class PullVolumeRuntimeStateTest(BaseBackendTest):
+
+    def setUp(self):
+        super(PullVolumeRuntimeStateTest, self).setUp()
+        self.volume = self.fixture.volume
+        self.backend_volume = self._get_valid_volume(self.volume.backend_id)
+        self.backend_volume.status = 'in-use'
+        self.backend_volume.attachments = [dict(device='/dev/vdb')]
+        self.cinder_client_mock.volumes.get.return_value = self.backend_volume
+
+    def test_device_is_not_pulled_together_with_runtime_state_by_default(self):
+        self.tenant_backend.pull_volume_runtime_state(self.volume)
+
+        self.volume.refresh_from_db()
+        self.assertEqual(self.volume.runtime_state, 'in-use')
+        self.assertEqual(self.volume.device, '')
+
+    def test_device_is_pulled_together_with_runtime_state_for_attached_volume(self):
+        self.tenant_backend.pull_attached_volume_runtime_state(self.volume)
+
+        self.volume.refresh_from_db()
+        self.assertEqual(self.volume.runtime_state, 'in-use')
+        self.assertEqual(self.volume.device, '/dev/vdb')
+        self.assertEqual(self.cinder_client_mock.volumes.get.call_count, 1)
+
+
 class PullInstanceTest(BaseBackendTest):
 
     def setUp(self):
@@ -499,6 +622,43 @@ class PullInstanceTest(BaseBackendTest):
         self.assertEqual(instance.error_message, 'Waldur error.')
 
 
+class PullInstanceSecurityGroupsTest(BaseBackendTest):
+    def setUp(self):
+        super(PullInstanceSecurityGroupsTest, self).setUp()
+        self.instance = self.fixture.instance
+
+    def setup_nova(self, *backend_ids):
+        self.nova_client_mock.servers.list_security_group.return_value = [
+            mock.Mock(id=backend_id) for backend_id in backend_ids
+        ]
+
+    def test_missing_security_groups_are_added(self):
+        first_group = factories.SecurityGroupFactory(settings=self.settings)
+        second_group = factories.SecurityGroupFactory(settings=self.settings)
+        self.setup_nova(first_group.backend_id, second_group.backend_id)
+
+        self.tenant_backend.pull_instance_security_groups(self.instance)
+
+        self.assertEqual(set(self.instance.security_groups.all()), {first_group, second_group})
+
+    def test_unknown_security_groups_are_skipped(self):
+        security_group = factories.SecurityGroupFactory(settings=self.settings)
+        self.setup_nova(security_group.backend_id, 'unknown_backend_id')
+
+        self.tenant_backend.pull_instance_security_groups(self.instance)
+
+        self.assertEqual(list(self.instance.security_groups.all()), [security_group])
+
+    def test_stale_security_groups_are_removed(self):
+        security_group = factories.SecurityGroupFactory(settings=self.settings)
+        self.instance.security_groups.add(security_group)
+        self.setup_nova()
+
+        self.tenant_backend.pull_instance_security_groups(self.instance)
+
+        self.assertFalse(self.instance.security_groups.exists())
+
+
 class PullInstanceInternalIpsTest(BaseBackendTest):
     def setup_neutron(self, port_id, device_id, subnet_id):
         self.neutron_client_mock.list_ports.return_value = {
@@ -1,6 +1,8 @@
 from django.test import TestCase
 
-from waldur_openstack.openstack_tenant.executors import InstanceFloatingIPsUpdateExecutor
+from waldur_core.core import utils as core_utils
+from waldur_openstack.openstack_tenant.executors import (
+    InstanceFloatingIPsUpdateExecutor, InstanceUpdateSecurityGroupsExecutor)
 
 from .. import factories
 
@@ -25,3 +27,16 @@ class InstanceFloatingIPsUpdateExecutorTest(TestCase):
         self.assertFalse(result['attached'])
         self.assertFalse(result['detached'])
         self.assertEqual(result['message'], 'Instance floating IPs have been updated.')
+
+
+class InstanceUpdateSecurityGroupsExecutorTest(TestCase):
+
+    def test_executor_returns_signature_that_pushes_security_groups(self):
+        instance = factories.InstanceFactory()
+        serialized_instance = core_utils.serialize_instance(instance)
+
+        signature = InstanceUpdateSecurityGroupsExecutor.get_task_signature(instance, serialized_instance)
+
+        self.assertIsNotNone(signature)
+        self.assertEqual(signature.kwargs['backend_method'], 'push_instance_security_groups')
+        self.assertEqual(signature.kwargs['state_transition'], 'begin_updating')
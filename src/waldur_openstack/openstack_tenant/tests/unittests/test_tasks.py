@@ -202,3 +202,18 @@ class SetErredProvisioningResourcesTaskTest(TestCase):
 
         self.assertEqual(ok_vm.state, models.Instance.States.CREATING)
         self.assertEqual(ok_volume.state, models.Volume.States.CREATING)
+
+
+class PollRuntimeStateBackoffTaskTest(TestCase):
+
+    @mock.patch('celery.app.task.Task.retry')
+    def test_retry_delay_is_doubled_up_to_max_delay(self, mocked_retry):
+        task = tasks.PollRuntimeStateBackoffTask()
+        task.initial_delay = 1
+        task.max_delay = 30
+
+        for retries, countdown in ((0, 1), (1, 2), (3, 8), (10, 30)):
+            task.push_request(retries=retries)
+            task.retry()
+            task.pop_request()
+            mocked_retry.assert_called_with(countdown=countdown)
@@ -2,7 +2,7 @@ from django.db.models import Count
 from django.utils.translation import ugettext_lazy as _
 from rest_framework import decorators, response, status, exceptions, serializers as rf_serializers
 
-from waldur_core.core import exceptions as core_exceptions, validators as core_validators
+from waldur_core.core import exceptions as core_exceptions, mixins as core_mixins, validators as core_validators
 from waldur_core.structure import views as structure_views, filters as structure_filters
 
 from . import models, serializers, filters, executors
@@ -228,7 +228,7 @@ class SecurityGroupViewSet(structure_views.BaseServicePropertyViewSet):
     filter_class = filters.SecurityGroupFilter
 
 
-class VolumeViewSet(structure_views.ImportableResourceViewSet):
+class VolumeViewSet(core_mixins.EagerLoadMixin, structure_views.ImportableResourceViewSet):
     queryset = models.Volume.objects.all()
     serializer_class = serializers.VolumeSerializer
     filter_class = filters.VolumeFilter
@@ -328,7 +328,7 @@ class VolumeViewSet(structure_views.ImportableResourceViewSet):
     import_resource_serializer_class = serializers.VolumeImportSerializer
 
 
-class SnapshotViewSet(structure_views.ImportableResourceViewSet):
+class SnapshotViewSet(core_mixins.EagerLoadMixin, structure_views.ImportableResourceViewSet):
     queryset = models.Snapshot.objects.all().order_by('name')
     serializer_class = serializers.SnapshotSerializer
     update_executor = executors.SnapshotUpdateExecutor